@@ -208,7 +208,10 @@ r"""
 # Modules
 r"""
 .. |compute| replace:: :mod:`~pyphi.compute`
+.. |compute.checkpoint| replace:: :mod:`pyphi.compute.checkpoint`
+.. |compute.cost| replace:: :mod:`pyphi.compute.cost`
 .. |compute.distance| replace:: :mod:`pyphi.compute.distance`
+.. |compute.distributed| replace:: :mod:`pyphi.compute.distributed`
 .. |compute.network| replace:: :mod:`pyphi.compute.network`
 .. |compute.parallel| replace:: :mod:`pyphi.compute.parallel`
 .. |compute.subsystem| replace:: :mod:`pyphi.compute.subsystem`
@@ -13,6 +13,7 @@ Memoization and caching utilities.
 
 import os
 import pickle
+import threading
 from functools import namedtuple, update_wrapper, wraps
 
 import psutil
@@ -160,17 +161,32 @@ class DictCache:
     """A generic dictionary-based cache.
 
     Intended to be used as an object-level cache of method results.
+
+    Access is guarded by a lock so that a single cache can be shared by the
+    workers of a thread-based parallel computation. The lock is dropped when
+    the cache is pickled and a fresh one is created when it is unpickled.
     """
 
     def __init__(self):
         self.cache = {}
         self.hits = 0
         self.misses = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     def clear(self):
-        self.cache = {}
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self.cache = {}
+            self.hits = 0
+            self.misses = 0
 
     def size(self):
         """Number of items in cache"""
@@ -186,15 +202,17 @@ class DictCache:
         Returns None if the key is not in the cache. Updates cache
         statistics.
         """
-        if key in self.cache:
-            self.hits += 1
-            return self.cache[key]
-        self.misses += 1
-        return None
+        with self._lock:
+            if key in self.cache:
+                self.hits += 1
+                return self.cache[key]
+            self.misses += 1
+            return None
 
     def set(self, key, value):
         """Set a value in the cache"""
-        self.cache[key] = value
+        with self._lock:
+            self.cache[key] = value
 
     # TODO: handle **kwarg keys if needed
     # See joblib.func_inspect.filter_args
@@ -366,7 +384,10 @@ class DictMICECache(DictCache):
         A |MICE| is affected if either the cut splits the mechanism
         or splits the connections between the purview and mechanism
         """
-        for key, mice in parent_cache.cache.items():
+        with parent_cache._lock:
+            items = list(parent_cache.cache.items())
+
+        for key, mice in items:
             if not mice.damaged_by_cut(self.subsystem):
                 self.cache[key] = mice
 
@@ -386,7 +407,8 @@ class DictMICECache(DictCache):
         """
         if (not self.subsystem.is_cut and mice.phi > 0 and
                 not memory_full()):
-            self.cache[key] = mice
+            with self._lock:
+                self.cache[key] = mice
 
     def key(self, direction, mechanism, purviews=False, _prefix=None):
         """Cache key. This is the call signature of |Subsystem.find_mice()|."""
@@ -420,7 +442,8 @@ class PurviewCache(DictCache):
     def set(self, key, value):
         """Only set if purview caching is enabled"""
         if config.CACHE_POTENTIAL_PURVIEWS:
-            self.cache[key] = value
+            with self._lock:
+                self.cache[key] = value
 
 
 def method(cache_name, key_prefix=None):
@@ -3,24 +3,34 @@
 # compute/__init__.py
 
 """
-See |compute.subsystem|, |compute.network|, |compute.distance|, and
-|compute.parallel| for documentation.
+See |compute.subsystem|, |compute.network|, |compute.distance|,
+|compute.parallel|, |compute.distributed|, |compute.cost|, and
+|compute.checkpoint| for documentation.
 
 Attributes:
     all_complexes: Alias for :func:`pyphi.compute.network.all_complexes`.
     ces: Alias for :func:`pyphi.compute.subsystem.ces`.
+    ces_async: Alias for :func:`pyphi.compute.subsystem.ces_async`.
     ces_distance: Alias for :func:`pyphi.compute.distance.ces_distance`.
     complexes: Alias for :func:`pyphi.compute.network.complexes`.
+    complexes_async: Alias for :func:`pyphi.compute.network.complexes_async`.
     concept_distance: Alias for
         :func:`pyphi.compute.distance.concept_distance`.
     conceptual_info: Alias for :func:`pyphi.compute.subsystem.conceptual_info`.
     condensed: Alias for :func:`pyphi.compute.network.condensed`.
+    estimate_cost: Alias for :func:`pyphi.compute.cost.estimate_cost`.
     evaluate_cut: Alias for :func:`pyphi.compute.subsystem.evaluate_cut`.
+    iter_all_complexes: Alias for
+        :func:`pyphi.compute.network.iter_all_complexes`.
+    iter_complexes: Alias for :func:`pyphi.compute.network.iter_complexes`.
     major_complex: Alias for :func:`pyphi.compute.network.major_complex`.
+    major_complex_async: Alias for
+        :func:`pyphi.compute.network.major_complex_async`.
     phi: Alias for :func:`pyphi.compute.subsystem.phi`.
     possible_complexes: Alias for
         :func:`pyphi.compute.network.possible_complexes`.
     sia: Alias for :func:`pyphi.compute.subsystem.sia`.
+    sia_async: Alias for :func:`pyphi.compute.subsystem.sia_async`.
     subsystems: Alias for :func:`pyphi.compute.network.subsystems`.
 """
 
@@ -29,7 +39,9 @@ Attributes:
 from .subsystem import (sia, phi, evaluate_cut, ConceptStyleSystem,
                         sia_concept_style, concept_cuts,
                         SystemIrreducibilityAnalysisConceptStyle,
-                        conceptual_info, ces)
-from .network import (all_complexes, complexes, condensed, major_complex,
-                      possible_complexes, subsystems)
+                        conceptual_info, ces, ces_async, sia_async)
+from .network import (all_complexes, complexes, complexes_async, condensed,
+                      iter_all_complexes, iter_complexes, major_complex,
+                      major_complex_async, possible_complexes, subsystems)
 from .distance import concept_distance, ces_distance
+from .cost import estimate_cost
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# compute/checkpoint.py
+
+"""
+Checkpoints for sweeps over the subsystems of a network.
+
+Passing ``checkpoint=<path>`` to :func:`~pyphi.compute.network.all_complexes`,
+:func:`~pyphi.compute.network.complexes` or
+:func:`~pyphi.compute.network.major_complex` records the progress of the sweep
+in a journal file. If the computation is interrupted, calling the same function
+again with the same network, state, configuration and journal file skips every
+subsystem which has already been evaluated.
+
+The journal is a JSON-lines file. The first line is a header identifying the
+sweep, the network, the state, and the configuration values which change the
+value of |big_phi|. Every following line records one evaluated subsystem:
+
+- ``subsystem``: the node indices of the subsystem,
+- ``phi``: its |big_phi| value, and
+- ``sia``: its full |SIA|, only if the sweep must return it. The journal of
+  :func:`~pyphi.compute.network.major_complex` only stores the |SIA| of each
+  new running best.
+
+Each record is flushed to disk as soon as the subsystem is evaluated. A
+partially written last line, left by a crash, is discarded when the journal is
+reopened.
+"""
+
+import json
+import logging
+import os
+
+import pyphi
+
+from .. import config, jsonify
+from .subsystem import _sia_config_key
+
+log = logging.getLogger(__name__)
+
+
+def _header(sweep, network, state):
+    """The header identifying a sweep."""
+    # Round-trip through JSON so that the header compares equal to the one
+    # read from the file.
+    return json.loads(json.dumps({
+        'sweep': sweep,
+        'network': hash(network),
+        'state': state,
+        'config': (config.SYSTEM_CUTS,) + _sia_config_key(),
+        'version': pyphi.__version__,
+    }))
+
+
+class Journal:
+    """A checkpoint file recording the subsystems evaluated by a sweep.
+
+    Opening a journal loads the records of any previous run. A new file is
+    created if ``path`` does not exist.
+
+    Args:
+        path (str): The path of the journal file.
+        sweep (str): The name of the sweep, *e.g.* ``'complexes'``.
+        network (Network): The network of the sweep.
+        state (tuple[int]): The state of the network.
+
+    Attributes:
+        evaluated (dict[tuple[int], float]): The |big_phi| value of each
+            evaluated subsystem, keyed by its node indices.
+        sias (list[SystemIrreducibilityAnalysis]): The stored |SIA|, in the
+            order in which they were recorded.
+
+    Raises:
+        ValueError: If the journal was written for a different sweep, network,
+            state, configuration or version of PyPhi.
+    """
+
+    def __init__(self, path, sweep, network, state):
+        self.path = path
+        self.header = _header(sweep, network, state)
+        self.evaluated = {}
+        self.sias = []
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self._load()
+        else:
+            self._write(self.header)
+
+        log.info('Opened checkpoint %s with %s evaluated subsystems', path,
+                 len(self.evaluated))
+
+    def _load(self):
+        """Load the records of a previous run."""
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+
+        if json.loads(lines[0].decode()) != self.header:
+            raise ValueError(
+                'Checkpoint {} was written for a different sweep, network, '
+                'state or configuration.'.format(self.path))
+
+        end = len(lines[0])
+        for line in lines[1:]:
+            try:
+                record = jsonify.loads(line.decode())
+            except ValueError:
+                # A partial record written when the previous run was killed
+                log.warning('Discarding incomplete record in checkpoint %s',
+                            self.path)
+                break
+            self.evaluated[record['subsystem']] = record['phi']
+            if 'sia' in record:
+                self.sias.append(record['sia'])
+            end += len(line)
+
+        # Drop any trailing partial record so that new records start on a
+        # fresh line
+        with open(self.path, 'r+b') as f:
+            f.truncate(end)
+
+    def _write(self, record):
+        with open(self.path, 'a') as f:
+            jsonify.dump(record, f)
+            f.write('\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def pending(self, subsystems):
+        """Filter out the subsystems which have already been evaluated."""
+        for subsystem in subsystems:
+            if subsystem.node_indices not in self.evaluated:
+                yield subsystem
+
+    def record(self, sia, keep):
+        """Record the |SIA| of an evaluated subsystem.
+
+        Args:
+            sia (SystemIrreducibilityAnalysis): The |SIA| of the subsystem.
+            keep (bool): Whether to store the full |SIA|, to be returned when
+                the sweep is resumed. Otherwise only |big_phi| is stored.
+        """
+        node_indices = sia.subsystem.node_indices
+        record = {'subsystem': node_indices, 'phi': sia.phi}
+        if keep:
+            record['sia'] = sia
+            self.sias.append(sia)
+
+        self._write(record)
+        self.evaluated[node_indices] = sia.phi
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# compute/cost.py
+
+"""
+Estimates of the time and memory needed to compute a |SIA|.
+
+The estimate is built from exact counts of the work done by
+:func:`~pyphi.compute.subsystem.sia` (mechanisms, potential purviews,
+mechanism partitions, and system cuts) combined with per-kernel timings. The
+default timings are rough; call :func:`calibrate` to measure them on the
+current machine.
+
+The model is pessimistic: it assumes that every mechanism must be recomputed
+for every cut, ignoring the reuse of |MICE| from the unpartitioned subsystem
+and the early exit when a cut with |big_phi = 0| is found. It is intended for
+admission control and scheduling, where the order of magnitude is what
+matters.
+
+Example:
+    >>> from pyphi import examples
+    >>> from pyphi.compute import cost
+    >>> estimate = cost.estimate_cost(examples.basic_subsystem())
+    >>> estimate.mechanisms, estimate.cuts
+    (7, 6)
+"""
+
+import logging
+from collections import namedtuple
+from time import time
+
+from .. import Direction, config, utils
+from ..partition import mip_partitions
+from .distance import concept_distance
+from .subsystem import _sia_cuts, ces
+
+log = logging.getLogger(__name__)
+
+#: Seconds per unit of work for each kernel.
+#:
+#: - ``'mip'``: evaluating one partition of a mechanism over a purview, per
+#:   state of the purview.
+#: - ``'distance'``: computing the distance between two concepts, per state of
+#:   the subsystem.
+TIMINGS = {
+    'mip': 2e-6,
+    'distance': 5e-6,
+}
+
+#: Bytes per element of a TPM or repertoire.
+ITEM_SIZE = 8
+
+Cost = namedtuple('Cost', [
+    'mechanisms', 'purviews', 'partitions', 'cuts', 'mip_work',
+    'distance_work', 'time', 'memory'])
+Cost.__doc__ = """The estimated cost of computing the |SIA| of a subsystem.
+
+Attributes:
+    mechanisms (int): The number of candidate mechanisms.
+    purviews (int): The number of potential (direction, mechanism, purview)
+        triples.
+    partitions (int): The number of mechanism partitions to evaluate, over
+        all purviews, for the current ``PARTITION_TYPE``.
+    cuts (int): The number of system cuts.
+    mip_work (int): Partitions weighted by the number of purview states.
+    distance_work (int): Concept distances weighted by the number of
+        subsystem states, over all cuts.
+    time (float): The estimated number of seconds needed to compute the
+        |SIA| sequentially.
+    memory (int): The estimated number of bytes held by the TPM and the
+        cached repertoires of the unpartitioned subsystem. Every worker
+        process of a parallel computation holds its own copy.
+"""
+
+# Numbers of partitions, keyed by partition type and sizes of the mechanism
+# and purview.
+_partition_counts = {}
+
+
+def count_partitions(mechanism_size, purview_size):
+    """Return the number of partitions yielded by
+    :func:`~pyphi.partition.mip_partitions` for a mechanism and purview of the
+    given sizes, under the current ``PARTITION_TYPE``.
+    """
+    if config.PARTITION_TYPE == 'BI':
+        # Every bipartition of the mechanism crossed with every directed
+        # bipartition of the purview, except those with an empty part.
+        return 2 ** (mechanism_size + purview_size - 1) - 1
+
+    key = (config.PARTITION_TYPE, mechanism_size, purview_size)
+    if key not in _partition_counts:
+        mechanism = tuple(range(mechanism_size))
+        purview = tuple(range(mechanism_size, mechanism_size + purview_size))
+        _partition_counts[key] = sum(
+            1 for _ in mip_partitions(mechanism, purview))
+    return _partition_counts[key]
+
+
+def _count(subsystem):
+    """Count the mechanisms, purviews, partitions and repertoire sizes."""
+    mechanisms = list(utils.powerset(subsystem.node_indices, nonempty=True))
+    purviews = partitions = mip_work = repertoire_size = 0
+
+    for direction in (Direction.CAUSE, Direction.EFFECT):
+        for mechanism in mechanisms:
+            for purview in subsystem.potential_purviews(direction, mechanism):
+                n = count_partitions(len(mechanism), len(purview))
+                purviews += 1
+                partitions += n
+                mip_work += n * 2 ** len(purview)
+                repertoire_size += 2 ** len(purview)
+
+    return len(mechanisms), purviews, partitions, mip_work, repertoire_size
+
+
+def estimate_cost(subsystem, timings=None):
+    """Estimate the cost of computing the |SIA| of a subsystem.
+
+    Args:
+        subsystem (Subsystem): The subsystem.
+
+    Keyword Args:
+        timings (dict): Per-kernel timings to use instead of :data:`TIMINGS`.
+
+    Returns:
+        Cost: The counts of work, and estimates of the time and memory.
+    """
+    timings = timings or TIMINGS
+
+    mechanisms, purviews, partitions, mip_work, repertoire_size = \
+        _count(subsystem)
+    cuts = len(_sia_cuts(subsystem))
+    states = 2 ** len(subsystem)
+
+    # The unpartitioned CES is computed once, and the partitioned CES once per
+    # cut. Each cut then compares every pair of concepts.
+    distance_work = cuts * mechanisms ** 2 * states
+
+    time_ = (timings['mip'] * mip_work * (cuts + 1) +
+             timings['distance'] * distance_work)
+
+    memory = ITEM_SIZE * (subsystem.tpm.size + repertoire_size)
+
+    return Cost(mechanisms=mechanisms, purviews=purviews,
+                partitions=partitions, cuts=cuts, mip_work=mip_work,
+                distance_work=distance_work, time=time_, memory=memory)
+
+
+def calibrate(subsystem=None):
+    """Measure the per-kernel timings on this machine and store them in
+    :data:`TIMINGS`.
+
+    .. note::
+        This clears the caches of the subsystem.
+
+    Keyword Args:
+        subsystem (Subsystem): The subsystem to time the kernels on. Defaults
+            to :func:`pyphi.examples.basic_subsystem`.
+
+    Returns:
+        dict: The new timings.
+    """
+    if subsystem is None:
+        from .. import examples
+        subsystem = examples.basic_subsystem()
+
+    subsystem.clear_caches()
+    mip_work = 0
+    start = time()
+    for direction in (Direction.CAUSE, Direction.EFFECT):
+        for mechanism in utils.powerset(subsystem.node_indices,
+                                        nonempty=True):
+            for purview in subsystem.potential_purviews(direction, mechanism):
+                subsystem.find_mip(direction, mechanism, purview)
+                mip_work += (count_partitions(len(mechanism), len(purview)) *
+                             2 ** len(purview))
+    mip_time = time() - start
+
+    concepts = ces(subsystem)
+    start = time()
+    for c1 in concepts:
+        for c2 in concepts:
+            concept_distance(c1, c2)
+    distance_time = time() - start
+    distance_work = len(concepts) ** 2 * 2 ** len(subsystem)
+
+    subsystem.clear_caches()
+
+    if mip_work:
+        TIMINGS['mip'] = mip_time / mip_work
+    if distance_work:
+        TIMINGS['distance'] = distance_time / distance_work
+
+    log.info('Calibrated kernel timings: %s', TIMINGS)
+    return TIMINGS
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# compute/distributed.py
+
+"""
+Distributed computation over Redis.
+
+When ``pyphi.config.PARALLEL_BACKEND`` is set to ``'redis'``, ``MapReduce``
+computations are not run by local worker processes. Instead, tasks are pushed
+onto a Redis list, from which they are popped by worker daemons running on any
+host that can reach the Redis server. Start a worker with::
+
+    pyphi-worker --host redis.example.org --processes 8
+
+Workers connect to the database given by ``pyphi.config.REDIS_CONFIG`` unless
+told otherwise on the command line. Every worker must be able to import the
+code which defines the computation, so it should run the same version of PyPhi
+as the client.
+
+Redis keys used by a job:
+
+- ``pyphi:tasks``: the list of pending tasks, shared by all jobs. Each entry is
+  a pickled ``(job_id, obj)`` pair.
+- ``pyphi:job:<job_id>:context``: the pickled ``compute`` function, context
+  objects, and configuration of the job. These are stored once per job rather
+  than once per task.
+- ``pyphi:job:<job_id>:results``: the list of pickled results.
+- ``pyphi:job:<job_id>:complete``: set when the job is finished or has
+  short-circuited. Workers drop any remaining tasks of the job.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import pickle
+import uuid
+
+import redis
+
+from .. import cache, config, constants
+from .parallel import ExceptionWrapper
+
+log = logging.getLogger(__name__)
+
+#: The Redis list holding the pending tasks of all jobs.
+TASK_QUEUE = 'pyphi:tasks'
+
+#: The number of seconds a finished job's ``complete`` key is kept, so that
+#: workers can discard its remaining tasks.
+COMPLETE_TTL = 24 * 60 * 60
+
+#: The number of seconds to block on Redis before checking for shutdown.
+POLL_TIMEOUT = 1
+
+#: The number of tasks pushed to Redis in a single round-trip.
+CHUNK_SIZE = 1000
+
+
+def _key(job_id, name):
+    return 'pyphi:job:{}:{}'.format(job_id, name)
+
+
+def _dumps(obj):
+    return pickle.dumps(obj, protocol=constants.PICKLE_PROTOCOL)
+
+
+def _config_values():
+    """The configuration to apply in the workers.
+
+    Options with an ``on_change`` callback, such as the logging options,
+    configure the worker process itself and are not sent. The workers compute
+    each task locally, so ``PARALLEL_BACKEND`` is reset to ``'process'``.
+    """
+    options = config.options()
+    values = {name: value for name, value in config.snapshot().items()
+              if options[name].on_change is None}
+    values['PARALLEL_BACKEND'] = 'process'
+    return values
+
+
+class Job:
+    """A ``MapReduce`` computation distributed over Redis.
+
+    Args:
+        compute (function): The ``compute`` function of the engine.
+        context (tuple): The context objects passed to ``compute``.
+
+    Keyword Args:
+        conn (redis.StrictRedis): The Redis connection to use. Defaults to
+            ``pyphi.cache.redis_conn``.
+    """
+
+    def __init__(self, compute, context, conn=None):
+        self.compute = compute
+        self.context = context
+        self.conn = conn if conn is not None else cache.redis_conn
+        self.job_id = uuid.uuid4().hex
+        self.finished = False
+
+    def start(self):
+        """Store the context of the job."""
+        log.debug('Starting distributed job %s', self.job_id)
+        self.conn.set(_key(self.job_id, 'context'),
+                      _dumps((self.compute, self.context, _config_values())))
+
+    def put(self, objs):
+        """Push tasks onto the task queue, returning the number of tasks."""
+        count = 0
+        chunk = []
+        for obj in objs:
+            chunk.append(_dumps((self.job_id, obj)))
+            count += 1
+            if len(chunk) == CHUNK_SIZE:
+                self.conn.rpush(TASK_QUEUE, *chunk)
+                chunk = []
+        if chunk:
+            self.conn.rpush(TASK_QUEUE, *chunk)
+        return count
+
+    def get(self):
+        """Block until the next result is available, and return it.
+
+        Returns ``None`` if the job is finished in the meantime.
+        """
+        key = _key(self.job_id, 'results')
+        while not self.finished:
+            item = self.conn.blpop(key, timeout=POLL_TIMEOUT)
+            if item is not None:
+                return pickle.loads(item[1])
+        return None
+
+    def finish(self):
+        """Signal workers to drop any remaining tasks, and clean up."""
+        log.debug('Finishing distributed job %s', self.job_id)
+        self.finished = True
+        pipe = self.conn.pipeline()
+        pipe.set(_key(self.job_id, 'complete'), 1, ex=COMPLETE_TTL)
+        pipe.delete(_key(self.job_id, 'context'), _key(self.job_id, 'results'))
+        pipe.execute()
+
+
+def work(conn=None, burst=False):
+    """Pop tasks from the task queue and compute them, forever.
+
+    Keyword Args:
+        conn (redis.StrictRedis): The Redis connection to use. Defaults to
+            ``pyphi.cache.redis_conn``.
+        burst (bool): If ``True``, return once the task queue is empty instead
+            of waiting for more tasks.
+    """
+    conn = conn if conn is not None else cache.redis_conn
+    # The context of the most recent job; consecutive tasks usually belong to
+    # the same job.
+    job_id, job = None, None
+
+    log.info('Worker listening on %s', TASK_QUEUE)
+
+    while True:
+        item = conn.blpop(TASK_QUEUE, timeout=POLL_TIMEOUT)
+        if item is None:
+            if burst:
+                break
+            continue
+
+        task_job_id, obj = pickle.loads(item[1])
+
+        if conn.exists(_key(task_job_id, 'complete')):
+            log.debug('Job %s is complete; dropping task', task_job_id)
+            continue
+
+        if task_job_id != job_id:
+            data = conn.get(_key(task_job_id, 'context'))
+            if data is None:
+                log.debug('No context for job %s; dropping task', task_job_id)
+                continue
+            job_id, job = task_job_id, pickle.loads(data)
+
+        compute, context, config_values = job
+
+        log.debug('Worker got %s', obj)
+        try:
+            with config.local(**config_values):
+                result = compute(obj, *context)
+        except Exception as e:  # pylint: disable=broad-except
+            result = ExceptionWrapper(e)
+        log.debug('Worker finished %s', obj)
+
+        if not conn.exists(_key(job_id, 'complete')):
+            conn.rpush(_key(job_id, 'results'), _dumps(result))
+
+
+def _work(host, port, db):
+    work(redis.StrictRedis(host=host, port=port, db=db))
+
+
+def main(argv=None):
+    """Command-line entry point for worker daemons."""
+    parser = argparse.ArgumentParser(
+        description='Run PyPhi workers which compute tasks from Redis.')
+    parser.add_argument('--host', default=config.REDIS_CONFIG['host'],
+                        help='Redis host (default: %(default)s)')
+    parser.add_argument('--port', type=int,
+                        default=config.REDIS_CONFIG['port'],
+                        help='Redis port (default: %(default)s)')
+    parser.add_argument('--db', type=int, default=config.REDIS_CONFIG['db'],
+                        help='Redis database (default: %(default)s)')
+    parser.add_argument('-n', '--processes', type=int, default=1,
+                        help='Number of worker processes (default: '
+                             '%(default)s)')
+    args = parser.parse_args(argv)
+
+    workers = [
+        multiprocessing.Process(target=_work,
+                                args=(args.host, args.port, args.db))
+        for i in range(args.processes)]
+
+    for worker in workers:
+        worker.start()
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == '__main__':
+    main()
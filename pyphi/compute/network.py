@@ -11,6 +11,7 @@ import logging
 from .. import config, exceptions, utils, validate
 from ..models import _null_sia
 from ..subsystem import Subsystem
+from .checkpoint import Journal
 from .parallel import MapReduce
 from .subsystem import sia
 
@@ -73,24 +74,50 @@ def possible_complexes(network, state):
 
 
 class FindAllComplexes(MapReduce):
-    """Computation engine for finding all complexes."""
+    """Computation engine for finding all complexes.
+
+    Keyword Args:
+        journal (Journal): A checkpoint journal. Subsystems which it records
+            as evaluated are skipped, and new results are recorded in it.
+    """
     # pylint: disable=unused-argument,arguments-differ
 
     description = 'Finding complexes'
 
+    def __init__(self, iterable, *context, journal=None):
+        self.journal = journal
+        if journal is not None:
+            iterable = journal.pending(iterable)
+        super().__init__(iterable, *context)
+
     def empty_result(self):
+        if self.journal is not None:
+            return list(self.journal.sias)
         return []
 
     @staticmethod
     def compute(subsystem):
         return sia(subsystem)
 
+    def record(self, new_sia, keep):
+        """Record a result in the journal, if there is one."""
+        if self.journal is not None:
+            self.journal.record(new_sia, keep)
+
     def process_result(self, new_sia, sias):
+        self.record(new_sia, keep=True)
         sias.append(new_sia)
         return sias
 
 
-def all_complexes(network, state):
+def _journal(checkpoint, sweep, network, state):
+    """Open the checkpoint journal of a sweep, if a path is given."""
+    if checkpoint is None:
+        return None
+    return Journal(checkpoint, sweep, network, state)
+
+
+def all_complexes(network, state, checkpoint=None):
     """Return a generator for all complexes of the network.
 
     .. note::
@@ -101,57 +128,177 @@ def all_complexes(network, state):
         network (Network): The |Network| of interest.
         state (tuple[int]): The state of the network (a binary tuple).
 
+    Keyword Args:
+        checkpoint (str): The path of a journal file in which to record
+            progress. If the file exists, the computation resumes from it. See
+            |compute.checkpoint|.
+
     Yields:
         SystemIrreducibilityAnalysis: A |SIA| for each |Subsystem| of the
         |Network|.
     """
-    engine = FindAllComplexes(subsystems(network, state))
+    journal = _journal(checkpoint, 'all_complexes', network, state)
+    engine = FindAllComplexes(subsystems(network, state), journal=journal)
     return engine.run(config.PARALLEL_COMPLEX_EVALUATION)
 
 
+def iter_all_complexes(network, state):
+    """Return a generator version of :func:`all_complexes`.
+
+    Each |SIA| is yielded as soon as it is computed, so that the complexes
+    can be processed without holding all of them in memory. In parallel, they
+    are yielded in the order in which they finish.
+
+    Args:
+        network (Network): The |Network| of interest.
+        state (tuple[int]): The state of the network (a binary tuple).
+
+    Yields:
+        SystemIrreducibilityAnalysis: A |SIA| for each |Subsystem| of the
+        |Network|.
+    """
+    engine = FindAllComplexes(subsystems(network, state))
+    yield from engine.run_iter(config.PARALLEL_COMPLEX_EVALUATION)
+
+
 class FindIrreducibleComplexes(FindAllComplexes):
     """Computation engine for finding irreducible complexes of a network."""
 
     def process_result(self, new_sia, sias):
+        self.record(new_sia, keep=new_sia.phi > 0)
         if new_sia.phi > 0:
             sias.append(new_sia)
         return sias
 
 
-def complexes(network, state):
+def complexes(network, state, checkpoint=None):
     """Return all irreducible complexes of the network.
 
     Args:
         network (Network): The |Network| of interest.
         state (tuple[int]): The state of the network (a binary tuple).
 
+    Keyword Args:
+        checkpoint (str): The path of a journal file in which to record
+            progress. If the file exists, the computation resumes from it. See
+            |compute.checkpoint|.
+
     Yields:
         SystemIrreducibilityAnalysis: A |SIA| for each |Subsystem| of the
         |Network|, excluding those with |big_phi = 0|.
     """
-    engine = FindIrreducibleComplexes(possible_complexes(network, state))
+    journal = _journal(checkpoint, 'complexes', network, state)
+    engine = FindIrreducibleComplexes(possible_complexes(network, state),
+                                      journal=journal)
     return engine.run(config.PARALLEL_COMPLEX_EVALUATION)
 
 
-def major_complex(network, state):
+def iter_complexes(network, state):
+    """Return a generator version of :func:`complexes`.
+
+    Each irreducible complex is yielded as soon as it is computed, so that
+    the complexes can be processed without holding all of them in memory. In
+    parallel, they are yielded in the order in which they finish.
+
+    Args:
+        network (Network): The |Network| of interest.
+        state (tuple[int]): The state of the network (a binary tuple).
+
+    Yields:
+        SystemIrreducibilityAnalysis: A |SIA| for each |Subsystem| of the
+        |Network|, excluding those with |big_phi = 0|.
+    """
+    engine = FindIrreducibleComplexes(possible_complexes(network, state))
+    for new_sia in engine.run_iter(config.PARALLEL_COMPLEX_EVALUATION):
+        if new_sia.phi > 0:
+            yield new_sia
+
+
+async def complexes_async(network, state, callback=None):
+    """Coroutine version of :func:`complexes`, which does not block the
+    event loop.
+
+    Keyword Args:
+        callback (function): Called with the |SIA| of each candidate
+            |Subsystem| as it is computed, including those with
+            |big_phi = 0|.
+    """
+    engine = FindIrreducibleComplexes(possible_complexes(network, state))
+    return await engine.run_async(config.PARALLEL_COMPLEX_EVALUATION,
+                                  callback)
+
+
+class FindMajorComplex(FindIrreducibleComplexes):
+    """Computation engine for finding the major complex of a network.
+
+    Only the running best |SIA| is kept, rather than every irreducible
+    complex.
+    """
+
+    def empty_result(self):
+        if self.journal is not None and self.journal.sias:
+            return max(self.journal.sias)
+        return None
+
+    def process_result(self, new_sia, best):
+        is_best = new_sia.phi > 0 and (best is None or new_sia > best)
+        self.record(new_sia, keep=is_best)
+        return new_sia if is_best else best
+
+
+def _major_complex(network, state, best):
+    """Return the best |SIA|, or the null |SIA| of the empty subsystem if
+    there is none.
+    """
+    if best is not None:
+        return best
+
+    empty_subsystem = Subsystem(network, state, ())
+    return _null_sia(empty_subsystem)
+
+
+def major_complex(network, state, checkpoint=None):
     """Return the major complex of the network.
 
     Args:
         network (Network): The |Network| of interest.
         state (tuple[int]): The state of the network (a binary tuple).
 
+    Keyword Args:
+        checkpoint (str): The path of a journal file in which to record
+            progress. If the file exists, the computation resumes from it. See
+            |compute.checkpoint|.
+
     Returns:
         SystemIrreducibilityAnalysis: The |SIA| for the |Subsystem| with
         maximal |big_phi|.
     """
     log.info('Calculating major complex...')
 
-    result = complexes(network, state)
-    if result:
-        result = max(result)
-    else:
-        empty_subsystem = Subsystem(network, state, ())
-        result = _null_sia(empty_subsystem)
+    journal = _journal(checkpoint, 'major_complex', network, state)
+    engine = FindMajorComplex(possible_complexes(network, state),
+                              journal=journal)
+    result = _major_complex(
+        network, state, engine.run(config.PARALLEL_COMPLEX_EVALUATION))
+
+    log.info("Finished calculating major complex.")
+
+    return result
+
+
+async def major_complex_async(network, state, callback=None):
+    """Coroutine version of :func:`major_complex`, which does not block the
+    event loop.
+
+    Keyword Args:
+        callback (function): Called with the |SIA| of each candidate
+            |Subsystem| as it is computed.
+    """
+    log.info('Calculating major complex...')
+
+    engine = FindMajorComplex(possible_complexes(network, state))
+    result = _major_complex(network, state, await engine.run_async(
+        config.PARALLEL_COMPLEX_EVALUATION, callback))
 
     log.info("Finished calculating major complex.")
 
@@ -7,8 +7,12 @@
 Utilities for parallel computation.
 """
 
+import asyncio
+import contextvars
+import functools
 import logging
 import multiprocessing
+import queue
 import sys
 import threading
 from itertools import chain, islice
@@ -67,12 +71,17 @@ class ExceptionWrapper:
 POISON_PILL = None
 Q_MAX_SIZE = multiprocessing.synchronize.SEM_VALUE_MAX
 
+# Thread-local state used to mark the worker threads of the thread backend.
+_worker_thread = threading.local()
+
 
 class MapReduce:
     """An engine for doing heavy computations over an iterable.
 
     This is similar to ``multiprocessing.Pool``, but allows computations to
     shortcircuit, and supports both parallel and sequential computations.
+    Computations can also be driven from an ``asyncio`` event loop with
+    ``run_async``.
 
     Args:
         iterable (Iterable): A collection of objects to perform a computation
@@ -88,8 +97,12 @@ class MapReduce:
     The engine includes a builtin ``tqdm`` progress bar; this can be disabled
     by setting ``pyphi.config.PROGRESS_BARS`` to ``False``.
 
-    Parallel operations start a daemon thread which handles log messages sent
-    from worker processes.
+    Parallel workers are either processes, threads, or remote workers fed
+    through Redis (see |compute.distributed|), depending on
+    ``pyphi.config.PARALLEL_BACKEND``. Process-based operations start a daemon
+    thread which handles log messages sent from worker processes. Thread-based
+    workers share the ``context`` objects, including any caches attached to
+    them, with the calling thread; nothing is copied.
 
     Subprocesses spawned by ``MapReduce`` cannot spawn more subprocesses; be
     aware of this when composing nested computations. This is not an issue in
@@ -113,6 +126,7 @@ class MapReduce:
         self.log_thread = None
         self.processes = None
         self.num_processes = None
+        self.backend = None
         self.tasks = None
         self.complete = None
 
@@ -140,11 +154,16 @@ class MapReduce:
     #: Is this process a subprocess in a parallel computation?
     _forked = False
 
+    @staticmethod
+    def _in_worker():
+        """Is this code running in a parallel worker process or thread?"""
+        return MapReduce._forked or getattr(_worker_thread, 'active', False)
+
     # TODO: pass size of iterable alongside?
     def init_progress_bar(self):
         """Initialize and return a progress bar."""
-        # Forked worker processes can't show progress bars.
-        disable = MapReduce._forked or not config.PROGRESS_BARS
+        # Parallel workers can't show progress bars.
+        disable = self._in_worker() or not config.PROGRESS_BARS
 
         # Don't materialize iterable unless we have to: huge iterables
         # (e.g. of `KCuts`) eat memory.
@@ -159,35 +178,72 @@ class MapReduce:
 
     @staticmethod  # coverage: disable
     def worker(compute, task_queue, result_queue, log_queue, complete,
-               *context):
-        """A worker process, run by ``multiprocessing.Process``."""
+               local_config, *context):
+        """A worker process, run by ``multiprocessing.Process``.
+
+        ``local_config`` holds the context-local configuration values of the
+        parent (see ``Config.local``), which are reapplied in the worker.
+        """
         try:
             MapReduce._forked = True
             log.debug('Worker process starting...')
 
             configure_worker_logging(log_queue)
 
-            for obj in iter(task_queue.get, POISON_PILL):
-                if complete.is_set():
-                    log.debug('Worker received signal - exiting early')
-                    break
+            with config.local(**local_config):
+                MapReduce.work(compute, task_queue, result_queue, complete,
+                               *context)
+            log.debug('Worker process exiting')
 
-                log.debug('Worker got %s', obj)
-                result_queue.put(compute(obj, *context))
-                log.debug('Worker finished %s', obj)
+        except Exception as e:  # pylint: disable=broad-except
+            result_queue.put(ExceptionWrapper(e))
 
-            result_queue.put(POISON_PILL)
-            log.debug('Worker process exiting')
+    @staticmethod
+    def thread_worker(compute, task_queue, result_queue, complete, *context):
+        """A worker thread, run by ``threading.Thread``."""
+        try:
+            _worker_thread.active = True
+            log.debug('Worker thread starting...')
+
+            MapReduce.work(compute, task_queue, result_queue, complete,
+                           *context)
+            log.debug('Worker thread exiting')
 
         except Exception as e:  # pylint: disable=broad-except
             result_queue.put(ExceptionWrapper(e))
 
-    def start_parallel(self):
-        """Initialize all queues and start the worker processes and the log
-        thread.
+    @staticmethod
+    def work(compute, task_queue, result_queue, complete, *context):
+        """Process tasks until a ``POISON_PILL`` is received or the
+        computation is complete.
         """
+        for obj in iter(task_queue.get, POISON_PILL):
+            if complete.is_set():
+                log.debug('Worker received signal - exiting early')
+                break
+
+            log.debug('Worker got %s', obj)
+            result_queue.put(compute(obj, *context))
+            log.debug('Worker finished %s', obj)
+
+        result_queue.put(POISON_PILL)
+
+    def start_parallel(self):
+        """Initialize all queues and start the workers."""
         self.num_processes = get_num_processes()
+        self.backend = config.PARALLEL_BACKEND
+
+        if self.backend == 'thread':
+            self.start_threads()
+        else:
+            self.start_processes()
+
+        self.initialize_tasks()
 
+    def start_processes(self):
+        """Initialize multiprocessing queues and start the worker processes
+        and the log thread.
+        """
         self.task_queue = multiprocessing.Queue(maxsize=Q_MAX_SIZE)
         self.result_queue = multiprocessing.Queue()
         self.log_queue = multiprocessing.Queue()
@@ -197,7 +253,8 @@ class MapReduce:
         self.complete = multiprocessing.Event()
 
         args = (self.compute, self.task_queue, self.result_queue,
-                self.log_queue, self.complete) + self.context
+                self.log_queue, self.complete,
+                config.local_values()) + self.context
         self.processes = [
             multiprocessing.Process(target=self.worker, args=args, daemon=True)
             for i in range(self.num_processes)]
@@ -208,7 +265,26 @@ class MapReduce:
         self.log_thread = LogThread(self.log_queue)
         self.log_thread.start()
 
-        self.initialize_tasks()
+    def start_threads(self):
+        """Initialize thread-safe queues and start the worker threads.
+
+        Worker threads log directly to the PyPhi handlers, so no log thread is
+        needed. Each thread runs in a copy of the current ``contextvars``
+        context, so that context-local configuration is inherited.
+        """
+        self.task_queue = queue.Queue(maxsize=Q_MAX_SIZE)
+        self.result_queue = queue.Queue()
+        self.complete = threading.Event()
+
+        args = (self.thread_worker, self.compute, self.task_queue,
+                self.result_queue, self.complete) + self.context
+        self.processes = [
+            threading.Thread(target=contextvars.copy_context().run, args=args,
+                             daemon=True)
+            for i in range(self.num_processes)]
+
+        for thread in self.processes:
+            thread.start()
 
     def initialize_tasks(self):
         """Load the input queue to capacity.
@@ -236,6 +312,9 @@ class MapReduce:
         """Perform the computation in parallel, reading results from the output
         queue and passing them to ``process_result``.
         """
+        if config.PARALLEL_BACKEND == 'redis':
+            return self.run_distributed()
+
         try:
             self.start_parallel()
 
@@ -243,24 +322,13 @@ class MapReduce:
 
             while self.num_processes > 0:
                 r = self.result_queue.get()
-                self.maybe_put_task()
-
-                if r is POISON_PILL:
-                    self.num_processes -= 1
-
-                elif isinstance(r, ExceptionWrapper):
-                    r.reraise()
-
-                else:
-                    result = self.process_result(r, result)
-                    self.progress.update(1)
-
-                    # Did `process_result` decide to terminate early?
-                    if self.done:
-                        self.complete.set()
+                result = self.reduce_parallel(r, result)
 
             self.finish_parallel()
         except Exception:
+            # Stop any workers which are still running
+            if self.complete is not None:
+                self.complete.set()
             raise
         finally:
             log.debug('Removing progress bar')
@@ -268,11 +336,62 @@ class MapReduce:
 
         return result
 
+    def reduce_parallel(self, r, result, callback=None):
+        """Handle an item read from the result queue, returning the new
+        accumulated result.
+        """
+        self.maybe_put_task()
+
+        if r is POISON_PILL:
+            self.num_processes -= 1
+
+        elif isinstance(r, ExceptionWrapper):
+            r.reraise()
+
+        else:
+            result = self.process_result(r, result)
+            self.progress.update(1)
+
+            if callback is not None:
+                callback(r)
+
+            # Did `process_result` decide to terminate early?
+            if self.done:
+                self.complete.set()
+
+        return result
+
+    def abort_parallel(self):
+        """Stop all workers after an error or cancellation.
+
+        Worker processes are terminated. Worker threads cannot be, so they
+        exit after finishing their current task. A ``POISON_PILL`` is put on
+        the result queue to release any thread still waiting on it.
+        """
+        if self.complete is None:
+            return
+
+        self.complete.set()
+
+        if self.backend != 'thread':
+            for process in self.processes:
+                process.terminate()
+            # Don't block at exit waiting to flush tasks that will never be
+            # read.
+            self.task_queue.cancel_join_thread()
+            self.log_queue.put(POISON_PILL)
+
+        self.result_queue.put(POISON_PILL)
+
     def finish_parallel(self):
         """Orderly shutdown of workers."""
         for process in self.processes:
             process.join()
 
+        # Thread queues don't need closing, and there is no log thread.
+        if self.backend == 'thread':
+            return
+
         # Shutdown the log thread
         log.debug('Joining log thread')
         self.log_queue.put(POISON_PILL)
@@ -306,6 +425,220 @@ class MapReduce:
 
         return result
 
+    def run_distributed(self):
+        """Perform the computation on remote workers, communicating through
+        Redis. See |compute.distributed|.
+        """
+        from . import distributed
+
+        job = distributed.Job(self.compute, self.context)
+        try:
+            job.start()
+            num_tasks = job.put(self.iterable)
+
+            result = self.empty_result(*self.context)
+
+            for _ in range(num_tasks):
+                result = self.reduce_distributed(job.get(), result)
+                if self.done:
+                    break
+        finally:
+            job.finish()
+            self.progress.close()
+
+        return result
+
+    def reduce_distributed(self, r, result, callback=None):
+        """Handle a result of a distributed computation, returning the new
+        accumulated result.
+        """
+        if isinstance(r, ExceptionWrapper):
+            r.reraise()
+
+        result = self.process_result(r, result)
+        self.progress.update(1)
+
+        if callback is not None:
+            callback(r)
+
+        return result
+
+    async def run_distributed_async(self, callback=None):
+        """Perform the computation on remote workers, waiting for results in
+        an executor so that the event loop is not blocked.
+        """
+        from . import distributed
+
+        job = distributed.Job(self.compute, self.context)
+        try:
+            job.start()
+            num_tasks = job.put(self.iterable)
+
+            result = self.empty_result(*self.context)
+
+            for _ in range(num_tasks):
+                r = await run_in_executor(job.get)
+                result = self.reduce_distributed(r, result, callback)
+                if self.done:
+                    break
+        finally:
+            # Also signals the workers and any pending ``job.get`` to stop if
+            # the task is cancelled.
+            job.finish()
+            self.progress.close()
+
+        return result
+
+    async def run_parallel_async(self, callback=None):
+        """Perform the computation in parallel, waiting for results in an
+        executor so that the event loop is not blocked.
+        """
+        if config.PARALLEL_BACKEND == 'redis':
+            return await self.run_distributed_async(callback)
+
+        loop = asyncio.get_event_loop()
+
+        try:
+            self.start_parallel()
+
+            result = self.empty_result(*self.context)
+
+            while self.num_processes > 0:
+                r = await loop.run_in_executor(None, self.result_queue.get)
+                result = self.reduce_parallel(r, result, callback)
+
+            self.finish_parallel()
+        except BaseException:
+            # Includes ``asyncio.CancelledError``
+            self.abort_parallel()
+            raise
+        finally:
+            self.progress.close()
+
+        return result
+
+    async def run_sequential_async(self, callback=None):
+        """Perform the computation sequentially, running each computation in
+        an executor so that the event loop is not blocked.
+        """
+        try:
+            result = self.empty_result(*self.context)
+
+            for obj in self.iterable:
+                r = await run_in_executor(self.compute, obj, *self.context)
+                result = self.process_result(r, result)
+                self.progress.update(1)
+
+                if callback is not None:
+                    callback(r)
+
+                # Short-circuited?
+                if self.done:
+                    break
+        finally:
+            self.progress.close()
+
+        return result
+
+    async def run_async(self, parallel=True, callback=None):
+        """Perform the computation without blocking the ``asyncio`` event
+        loop.
+
+        Cancelling the task stops the computation: worker processes are
+        terminated, and worker threads exit after their current task. A
+        computation which is already running in an executor thread cannot be
+        interrupted, but its result is discarded.
+
+        Keyword Args:
+            parallel (boolean): If True, run the computation in parallel.
+                Otherwise, operate sequentially.
+            callback (function): Called with each result of ``compute`` as it
+                is reduced, to stream intermediate results.
+        """
+        if parallel:
+            return await self.run_parallel_async(callback)
+        return await self.run_sequential_async(callback)
+
+    def run_iter_parallel(self):
+        """Yield the results of a parallel computation in the order in which
+        they finish.
+        """
+        if config.PARALLEL_BACKEND == 'redis':
+            yield from self.run_iter_distributed()
+            return
+
+        try:
+            self.start_parallel()
+
+            while self.num_processes > 0:
+                r = self.result_queue.get()
+                self.maybe_put_task()
+
+                if r is POISON_PILL:
+                    self.num_processes -= 1
+                elif isinstance(r, ExceptionWrapper):
+                    r.reraise()
+                else:
+                    self.progress.update(1)
+                    yield r
+
+            self.finish_parallel()
+        except BaseException:
+            # Includes ``GeneratorExit`` if the generator is closed early
+            self.abort_parallel()
+            raise
+        finally:
+            self.progress.close()
+
+    def run_iter_distributed(self):
+        """Yield the results of a distributed computation in the order in
+        which they finish.
+        """
+        from . import distributed
+
+        job = distributed.Job(self.compute, self.context)
+        try:
+            job.start()
+            num_tasks = job.put(self.iterable)
+
+            for _ in range(num_tasks):
+                r = job.get()
+                if isinstance(r, ExceptionWrapper):
+                    r.reraise()
+                self.progress.update(1)
+                yield r
+        finally:
+            job.finish()
+            self.progress.close()
+
+    def run_iter_sequential(self):
+        """Yield the results of a sequential computation one at a time."""
+        try:
+            for obj in self.iterable:
+                r = self.compute(obj, *self.context)
+                self.progress.update(1)
+                yield r
+        finally:
+            self.progress.close()
+
+    def run_iter(self, parallel=True):
+        """Return a generator over the results of ``compute``, yielding each
+        result as soon as it is available.
+
+        The results are not reduced: ``empty_result`` and ``process_result``
+        are not called. Nothing is computed until the generator is iterated,
+        and closing it early stops the computation: worker processes are
+        terminated, and worker threads exit after their current task.
+
+        Keyword Args:
+            parallel (boolean): If True, run the computation in parallel, and
+                yield results in the order in which they finish. Otherwise,
+                operate sequentially.
+        """
+        if parallel:
+            return self.run_iter_parallel()
+        return self.run_iter_sequential()
+
     def run(self, parallel=True):
         """Perform the computation.
 
@@ -318,6 +651,18 @@ class MapReduce:
         return self.run_sequential()
 
 
+async def run_in_executor(func, *args):
+    """Call ``func(*args)`` in the default executor of the event loop.
+
+    The call is made in a copy of the current ``contextvars`` context, so that
+    context-local configuration is respected.
+    """
+    loop = asyncio.get_event_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        None, functools.partial(context.run, func, *args))
+
+
 # TODO: maintain a single log thread?
 class LogThread(threading.Thread):
     """Thread which handles log records sent from ``MapReduce`` processes.
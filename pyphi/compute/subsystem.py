@@ -14,9 +14,9 @@ from ..models import (CauseEffectStructure, Concept, Cut, KCut,
                       SystemIrreducibilityAnalysis, _null_sia, cmp, fmt)
 from ..partition import (directed_bipartition, directed_bipartition_of_one,
                          mip_partitions)
-from ..utils import time_annotated
+from ..utils import time_annotated, time_annotated_async
 from .distance import ces_distance
-from .parallel import MapReduce
+from .parallel import MapReduce, run_in_executor
 
 # Create a logger for this module.
 log = logging.getLogger(__name__)
@@ -99,6 +99,31 @@ def ces(subsystem, mechanisms=False, purviews=False, cause_purviews=False,
                                 subsystem=subsystem)
 
 
+@time_annotated_async
+async def ces_async(subsystem, mechanisms=False, purviews=False,
+                    cause_purviews=False, effect_purviews=False,
+                    parallel=False, callback=None):
+    """Coroutine version of :func:`ces`, which does not block the event
+    loop.
+
+    Keyword Args:
+        callback (function): Called with each |Concept| as it is computed,
+            including reducible concepts which are not part of the
+            |CauseEffectStructure|.
+
+    See :func:`ces` for the other arguments.
+    """
+    if mechanisms is False:
+        mechanisms = utils.powerset(subsystem.node_indices, nonempty=True)
+
+    engine = ComputeCauseEffectStructure(mechanisms, subsystem, purviews,
+                                         cause_purviews, effect_purviews)
+
+    concepts = await engine.run_async(
+        parallel or config.PARALLEL_CONCEPT_EVALUATION, callback)
+    return CauseEffectStructure(concepts, subsystem=subsystem)
+
+
 def conceptual_info(subsystem):
     """Return the conceptual information for a |Subsystem|.
 
@@ -209,23 +234,10 @@ def _ces(subsystem):
     return ces(subsystem, parallel=config.PARALLEL_CUT_EVALUATION)
 
 
-@memory.cache(ignore=["subsystem"])
-@time_annotated
-def _sia(cache_key, subsystem):
-    """Return the minimal information partition of a subsystem.
-
-    Args:
-        subsystem (Subsystem): The candidate set of nodes.
-
-    Returns:
-        SystemIrreducibilityAnalysis: A nested structure containing all the
-        data from the intermediate calculations. The top level contains the
-        basic irreducibility information for the given subsystem.
+def _degenerate_sia(subsystem):
+    """Return a null |SIA| if |big_phi| is trivially zero for the subsystem,
+    otherwise ``None``.
     """
-    # pylint: disable=unused-argument
-
-    log.info('Calculating big-phi data for %s...', subsystem)
-
     # Check for degenerate cases
     # =========================================================================
     # Phi is necessarily zero if the subsystem is:
@@ -259,6 +271,41 @@ def _sia(cache_key, subsystem):
             return _null_sia(subsystem)
     # =========================================================================
 
+    return None
+
+
+def _sia_cuts(subsystem):
+    """Return the cuts to evaluate when computing the |SIA| of a subsystem."""
+    # TODO: move this into sia_bipartitions?
+    # Only True if SINGLE_MICRO_NODES...=True, no?
+    if len(subsystem.cut_indices) == 1:
+        return [Cut(subsystem.cut_indices, subsystem.cut_indices,
+                    subsystem.cut_node_labels)]
+
+    return sia_bipartitions(subsystem.cut_indices, subsystem.cut_node_labels)
+
+
+@memory.cache(ignore=["subsystem"])
+@time_annotated
+def _sia(cache_key, subsystem):
+    """Return the minimal information partition of a subsystem.
+
+    Args:
+        subsystem (Subsystem): The candidate set of nodes.
+
+    Returns:
+        SystemIrreducibilityAnalysis: A nested structure containing all the
+        data from the intermediate calculations. The top level contains the
+        basic irreducibility information for the given subsystem.
+    """
+    # pylint: disable=unused-argument
+
+    log.info('Calculating big-phi data for %s...', subsystem)
+
+    result = _degenerate_sia(subsystem)
+    if result is not None:
+        return result
+
     log.debug('Finding unpartitioned CauseEffectStructure...')
     unpartitioned_ces = _ces(subsystem)
 
@@ -270,17 +317,8 @@ def _sia(cache_key, subsystem):
 
     log.debug('Found unpartitioned CauseEffectStructure.')
 
-    # TODO: move this into sia_bipartitions?
-    # Only True if SINGLE_MICRO_NODES...=True, no?
-    if len(subsystem.cut_indices) == 1:
-        cuts = [Cut(subsystem.cut_indices, subsystem.cut_indices,
-                    subsystem.cut_node_labels)]
-    else:
-        cuts = sia_bipartitions(subsystem.cut_indices,
-                                subsystem.cut_node_labels)
-
     engine = ComputeSystemIrreducibility(
-        cuts, subsystem, unpartitioned_ces)
+        _sia_cuts(subsystem), subsystem, unpartitioned_ces)
     result = engine.run(config.PARALLEL_CUT_EVALUATION)
 
     if config.CLEAR_SUBSYSTEM_CACHES_AFTER_COMPUTING_SIA:
@@ -294,14 +332,9 @@ def _sia(cache_key, subsystem):
 
 # TODO(maintainance): don't forget to add any new configuration options here if
 # they can change big-phi values
-def _sia_cache_key(subsystem):
-    """The cache key of the subsystem.
-
-    This includes the native hash of the subsystem and all configuration values
-    which change the results of ``sia``.
-    """
+def _sia_config_key():
+    """The configuration values which change the results of ``sia``."""
     return (
-        hash(subsystem),
         config.ASSUME_CUTS_CANNOT_CREATE_NEW_CONCEPTS,
         config.CUT_ONE_APPROXIMATION,
         config.MEASURE,
@@ -312,6 +345,15 @@ def _sia_cache_key(subsystem):
     )
 
 
+def _sia_cache_key(subsystem):
+    """The cache key of the subsystem.
+
+    This includes the native hash of the subsystem and all configuration values
+    which change the results of ``sia``.
+    """
+    return (hash(subsystem),) + _sia_config_key()
+
+
 # Wrapper to ensure that the cache key is the native hash of the subsystem, so
 # joblib doesn't mistakenly recompute things when the subsystem's MICE cache is
 # changed. The cache is also keyed on configuration values which affect the
@@ -324,6 +366,59 @@ def sia(subsystem):  # pylint: disable=missing-docstring
     return _sia(_sia_cache_key(subsystem), subsystem)
 
 
+@time_annotated_async
+async def _sia_async(subsystem, callback=None):
+    """Coroutine version of ``_sia``."""
+    log.info('Calculating big-phi data for %s...', subsystem)
+
+    result = _degenerate_sia(subsystem)
+    if result is not None:
+        return result
+
+    log.debug('Finding unpartitioned CauseEffectStructure...')
+    unpartitioned_ces = await ces_async(
+        subsystem, parallel=config.PARALLEL_CUT_EVALUATION, callback=callback)
+
+    if not unpartitioned_ces:
+        log.info('Empty unpartitioned CauseEffectStructure; returning null '
+                 'SIA immediately.')
+        return _null_sia(subsystem)
+
+    log.debug('Found unpartitioned CauseEffectStructure.')
+
+    engine = ComputeSystemIrreducibility(
+        _sia_cuts(subsystem), subsystem, unpartitioned_ces)
+    result = await engine.run_async(config.PARALLEL_CUT_EVALUATION, callback)
+
+    if config.CLEAR_SUBSYSTEM_CACHES_AFTER_COMPUTING_SIA:
+        log.debug('Clearing subsystem caches.')
+        subsystem.clear_caches()
+
+    log.info('Finished calculating big-phi data for %s.', subsystem)
+
+    return result
+
+
+async def sia_async(subsystem, callback=None):
+    """Coroutine version of :func:`sia`, which does not block the event
+    loop.
+
+    Keyword Args:
+        callback (function): Called with each |Concept| of the unpartitioned
+            |CauseEffectStructure| as it is computed, then with the |SIA| of
+            each cut as it is evaluated.
+
+    .. note::
+        If :data:`config.CACHE_SIAS` is enabled or concept-style system cuts
+        are used, the whole computation is run by :func:`sia` in an executor
+        and ``callback`` is not called.
+    """
+    if config.SYSTEM_CUTS == 'CONCEPT_STYLE' or config.CACHE_SIAS:
+        return await run_in_executor(sia, subsystem)
+
+    return await _sia_async(subsystem, callback)
+
+
 def phi(subsystem):
     """Return the |big_phi| value of a subsystem."""
     return sia(subsystem).phi
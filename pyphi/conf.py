@@ -45,6 +45,15 @@ Or load a dictionary of configuration values:
 
     >>> pyphi.config.load_dict({'PRECISION': 1})
 
+These changes are global: they are seen by every thread in the process. To
+change settings for a single thread or ``asyncio`` task, use
+:meth:`~pyphi.conf.Config.local`; the new values are only visible in the
+current execution context:
+
+    >>> with pyphi.config.local(MEASURE='L1'):
+    ...     pyphi.config.MEASURE
+    'L1'
+
 
 Approximations and theoretical options
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -75,6 +84,7 @@ long time!), resulting in data loss.
 - :attr:`~pyphi.conf.PyphiConfig.PARALLEL_CONCEPT_EVALUATION`
 - :attr:`~pyphi.conf.PyphiConfig.PARALLEL_CUT_EVALUATION`
 - :attr:`~pyphi.conf.PyphiConfig.PARALLEL_COMPLEX_EVALUATION`
+- :attr:`~pyphi.conf.PyphiConfig.PARALLEL_BACKEND`
 - :attr:`~pyphi.conf.PyphiConfig.NUMBER_OF_CORES`
 - :attr:`~pyphi.conf.PyphiConfig.MAXIMUM_CACHE_MEMORY_PERCENTAGE`
 
@@ -137,6 +147,7 @@ The ``config`` API
 # pylint: disable=protected-access
 
 import contextlib
+import contextvars
 import logging
 import logging.config
 import os
@@ -191,11 +202,21 @@ class Option:
     def __get__(self, obj, cls=None):
         if obj is None:
             return self
+        local_values = obj._local_values.get()
+        if local_values and self.name in local_values:
+            return local_values[self.name]
         return obj._values[self.name]
 
     def __set__(self, obj, value):
         self._validate(value)
-        obj._values[self.name] = value
+        local_values = obj._local_values.get()
+        if local_values and self.name in local_values:
+            # The option is overridden in this context; only change the
+            # context-local value.
+            local_values = dict(local_values, **{self.name: value})
+            obj._local_values.set(local_values)
+        else:
+            obj._values[self.name] = value
         self._callback(obj)
 
     def _validate(self, value):
@@ -237,6 +258,9 @@ class Config(metaclass=ConfigMeta):
     def __init__(self):
         self._values = {}
         self._loaded_files = []
+        # Values which override ``_values`` in the current execution context
+        self._local_values = contextvars.ContextVar(
+            '{}_local_values'.format(type(self).__name__), default=None)
 
         # Set the default value of each ``Option``
         for name, opt in self.options().items():
@@ -250,7 +274,7 @@ class Config(metaclass=ConfigMeta):
             opt._callback(self)
 
     def __str__(self):
-        return pprint.pformat(self._values, indent=2)
+        return pprint.pformat(self.snapshot(), indent=2)
 
     def __setattr__(self, name, value):
         if name.startswith('_') or name in self.options().keys():
@@ -282,8 +306,19 @@ class Config(metaclass=ConfigMeta):
         self._loaded_files.append(filename)
 
     def snapshot(self):
-        """Return a snapshot of the current values of this configuration."""
-        return copy(self._values)
+        """Return a snapshot of the current values of this configuration.
+
+        This includes any context-local values set with ``local``.
+        """
+        values = copy(self._values)
+        values.update(self.local_values())
+        return values
+
+    def local_values(self):
+        """Return the values which are overridden in the current execution
+        context by ``local``.
+        """
+        return copy(self._local_values.get() or {})
 
     def override(self, **new_values):
         """Decorator and context manager to override configuration values.
@@ -306,6 +341,63 @@ class Config(metaclass=ConfigMeta):
         """
         return _override(self, **new_values)
 
+    def local(self, **new_values):
+        """Decorator and context manager to override configuration values in
+        the current execution context only.
+
+        Unlike ``override``, the new values are not visible to other threads or
+        ``asyncio`` tasks, so concurrent computations in a single process can
+        use different settings. Threads and tasks started inside the block do
+        not inherit the values unless they are run in a copy of the current
+        context (see ``contextvars.copy_context``); the worker threads of
+        ``MapReduce`` do this automatically.
+
+        Options with an ``on_change`` callback, such as the logging options,
+        configure process-wide state and cannot be set locally.
+
+        Example:
+            >>> from pyphi import config
+            >>> with config.local(PRECISION=100):
+            ...     assert config.PRECISION == 100
+            ...
+        """
+        return _local(self, **new_values)
+
+
+class _local(contextlib.ContextDecorator):
+    """See ``Config.local`` for usage."""
+
+    def __init__(self, conf, **new_values):
+        options = conf.options()
+        for name, value in new_values.items():
+            if name not in options:
+                raise ValueError('{} is not a valid config option'.format(name))
+            if options[name].on_change is not None:
+                raise ValueError(
+                    '{} cannot be set locally because it has an on_change '
+                    'callback'.format(name))
+            options[name]._validate(value)
+
+        self.conf = conf
+        self.new_values = new_values
+        self.tokens = []
+
+    def _recreate_cm(self):
+        # Each use as a decorator gets a fresh instance, so that concurrent
+        # calls in different contexts don't share tokens.
+        return type(self)(self.conf, **self.new_values)
+
+    def __enter__(self):
+        """Set the context-local values."""
+        values = self.conf.local_values()
+        values.update(self.new_values)
+        self.tokens.append(self.conf._local_values.set(values))
+
+    def __exit__(self, *exc):
+        """Reset the context-local values; reraise any exceptions."""
+        self.conf._local_values.reset(self.tokens.pop())
+        return False
+
 
 class _override(contextlib.ContextDecorator):
     """See ``Config.override`` for usage."""
@@ -410,6 +502,17 @@ class PyphiConfig(Config):
     Controls whether systems are evaluated in parallel when computing
     complexes.""")
 
+    PARALLEL_BACKEND = Option('process', values=['process', 'thread', 'redis'],
+                              doc="""
+    Controls how parallel computations are distributed. ``'process'`` runs
+    each worker in a separate process, which sidesteps the GIL but gives each
+    worker its own copy of the subsystem and its caches. ``'thread'`` runs the
+    workers as threads in the current process: they share the subsystem and
+    its caches, so no copying is needed, at the cost of only running
+    concurrently while NumPy has released the GIL. ``'redis'`` sends the tasks
+    through the Redis server configured by ``REDIS_CONFIG`` to worker daemons,
+    which may run on other machines; see |compute.distributed|.""")
+
     NUMBER_OF_CORES = Option(-1, doc="""
     Controls the number of CPU cores used to evaluate unidirectional cuts.
     Negative numbers count backwards from the total number of available cores,
@@ -7,6 +7,7 @@ Functions used by more than one PyPhi module or class, or that might be of
 external use.
 """
 
+import functools
 import hashlib
 import os
 from itertools import chain, combinations, product
@@ -215,3 +216,16 @@ def time_annotated(func, *args, **kwargs):
     end = time()
     result.time = round(end - start, config.PRECISION)
     return result
+
+
+def time_annotated_async(func):
+    """Coroutine version of :func:`time_annotated`."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time()
+        result = await func(*args, **kwargs)
+        end = time()
+        result.time = round(end - start, config.PRECISION)
+        return result
+
+    return wrapper
@@ -14,6 +14,7 @@ with open('./pyphi/__about__.py', encoding='utf-8') as f:
     exec(f.read(), about)
 
 install_requires = [
+    'contextvars >=2.1; python_version < "3.7"',
     'decorator >=4.0.0',
     'joblib >=0.8.0',
     'numpy >=1.11.0',
@@ -38,10 +39,16 @@ setup(
     long_description=readme,
     long_description_content_type='text/markdown',
     install_requires=install_requires,
+    python_requires='>=3.6',
     keywords=('neuroscience causality causal-modeling causation '
               'integrated-information-theory iit integrated-information '
               'modeling'),
     packages=find_packages(exclude=['docs', 'test']),
+    entry_points={
+        'console_scripts': [
+            'pyphi-worker = pyphi.compute.distributed:main',
+        ],
+    },
     include_package_data=True,
     zip_safe=False,
     classifiers=[
@@ -49,8 +56,6 @@ setup(
         'Intended Audience :: Developers',
         'Natural Language :: English',
         'License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Topic :: Scientific/Engineering',
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # test_big_phi.py
 
+import asyncio
 import pickle
 
 import pytest
@@ -390,6 +391,50 @@ def test_all_complexes_parallelization(s):
     assert sorted(serial) == sorted(parallel)
 
 
+@pytest.mark.parametrize('parallel', [True, False])
+def test_iter_complexes(s, parallel):
+    with config.override(PARALLEL_COMPLEX_EVALUATION=parallel):
+        assert (sorted(compute.iter_complexes(s.network, s.state)) ==
+                sorted(compute.complexes(s.network, s.state)))
+        assert (sorted(compute.iter_all_complexes(s.network, s.state)) ==
+                sorted(compute.all_complexes(s.network, s.state)))
+
+
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize('parallel', [True, False])
+def test_sia_async_standard_example(s, parallel):
+    results = []
+    with config.override(PARALLEL_CUT_EVALUATION=parallel):
+        sia = run_async(compute.sia_async(s, callback=results.append))
+    check_sia(sia, standard_answer)
+    assert sia.time is not None
+    # Concepts of the unpartitioned CES, then one SIA per evaluated cut
+    assert any(isinstance(r, models.Concept) for r in results)
+    assert any(isinstance(r, models.SystemIrreducibilityAnalysis)
+               for r in results)
+
+
+def test_ces_async(s):
+    assert run_async(compute.ces_async(s)) == compute.ces(s)
+
+
+def test_major_complex_async(s):
+    results = []
+    major = run_async(
+        compute.major_complex_async(s.network, s.state,
+                                    callback=results.append))
+    check_sia(major, standard_answer)
+    assert len(results) == len(list(compute.possible_complexes(s.network,
+                                                               s.state)))
+
+
 def test_sia_complete_graph_standard_example(s_complete):
     sia = compute.sia(s_complete)
     check_sia(sia, standard_answer)
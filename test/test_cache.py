@@ -1,5 +1,7 @@
 import functools
 import multiprocessing
+import pickle
+import threading
 from unittest import mock
 
 import pytest
@@ -33,6 +35,38 @@ def test_cache():
     assert c.misses == 0
 
 
+def test_cache_is_thread_safe():
+    c = cache.DictCache()
+
+    def worker(i):
+        for j in range(1000):
+            key = (i, j)
+            assert c.get(key) is None
+            c.set(key, j)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert c.size() == 8000
+    assert c.info() == (0, 8000, 8000)
+
+
+def test_cache_can_be_pickled():
+    c = cache.DictCache()
+    c.set('key', 'value')
+    c.get('key')
+
+    c2 = pickle.loads(pickle.dumps(c))
+    assert c2.cache == c.cache
+    assert c2.info() == c.info()
+    # The unpickled cache has its own lock
+    c2.set('other', 'value')
+    assert c2.get('other') == 'value'
+
+
 class SomeObject:
     """Object for testing cache decorator"""
     def __init__(self):
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# test_checkpoint.py
+
+import numpy as np
+import pytest
+
+from pyphi import Network, compute, config
+from pyphi.compute import checkpoint, network
+
+
+@pytest.fixture
+def disconnected():
+    """A network in which every SIA is trivially null."""
+    return Network(np.zeros((8, 3)), cm=np.zeros((3, 3), dtype=int))
+
+
+@pytest.fixture
+def no_compute(monkeypatch):
+    """Fail if any subsystem is evaluated."""
+    def compute(subsystem):
+        raise AssertionError('{} was recomputed'.format(subsystem))
+    monkeypatch.setattr(network.FindAllComplexes, 'compute',
+                        staticmethod(compute))
+
+
+def test_all_complexes_resume(disconnected, tmpdir):
+    path = str(tmpdir.join('journal.jsonl'))
+    state = (0, 0, 0)
+    sias = compute.all_complexes(disconnected, state, checkpoint=path)
+    assert len(sias) == 7
+
+    journal = checkpoint.Journal(path, 'all_complexes', disconnected, state)
+    assert len(journal.evaluated) == 7
+    assert journal.sias == sias
+
+
+def test_resume_skips_evaluated_subsystems(s, tmpdir, no_compute):
+    path = str(tmpdir.join('journal.jsonl'))
+    journal = checkpoint.Journal(path, 'complexes', s.network, s.state)
+    for subsystem in compute.possible_complexes(s.network, s.state):
+        journal.record(compute.sia(subsystem), keep=True)
+
+    sias = compute.complexes(s.network, s.state, checkpoint=path)
+    assert sias == journal.sias
+
+
+def test_major_complex_resume(s, tmpdir):
+    path = str(tmpdir.join('journal.jsonl'))
+    major = compute.major_complex(s.network, s.state, checkpoint=path)
+    assert major == compute.major_complex(s.network, s.state)
+
+    # Only the running best SIAs are stored
+    journal = checkpoint.Journal(path, 'major_complex', s.network, s.state)
+    assert len(journal.evaluated) == len(
+        list(compute.possible_complexes(s.network, s.state)))
+    assert max(journal.sias) == major
+    assert len(journal.sias) < len(journal.evaluated)
+
+
+def test_partial_resume(s, tmpdir, monkeypatch):
+    path = str(tmpdir.join('journal.jsonl'))
+    candidates = list(compute.possible_complexes(s.network, s.state))
+
+    journal = checkpoint.Journal(path, 'major_complex', s.network, s.state)
+    journal.record(compute.sia(candidates[0]), keep=True)
+
+    computed = []
+    original = network.FindAllComplexes.compute
+
+    def compute_(subsystem):
+        computed.append(subsystem)
+        return original(subsystem)
+
+    monkeypatch.setattr(network.FindAllComplexes, 'compute',
+                        staticmethod(compute_))
+    with config.override(PARALLEL_COMPLEX_EVALUATION=False):
+        major = compute.major_complex(s.network, s.state, checkpoint=path)
+
+    assert computed == candidates[1:]
+    assert major == compute.major_complex(s.network, s.state)
+
+
+def test_incomplete_record_is_discarded(disconnected, tmpdir, no_compute):
+    path = str(tmpdir.join('journal.jsonl'))
+    state = (0, 0, 0)
+    journal = checkpoint.Journal(path, 'all_complexes', disconnected, state)
+    sia = compute.sia(next(compute.subsystems(disconnected, state)))
+    journal.record(sia, keep=True)
+
+    with open(path, 'a') as f:
+        f.write('{"subsystem": [0, 1], "ph')
+
+    journal = checkpoint.Journal(path, 'all_complexes', disconnected, state)
+    assert list(journal.evaluated) == [sia.subsystem.node_indices]
+    assert journal.sias == [sia]
+
+    journal.record(sia, keep=False)
+    journal = checkpoint.Journal(path, 'all_complexes', disconnected, state)
+    assert journal.sias == [sia]
+
+
+def test_mismatched_journal(disconnected, tmpdir):
+    path = str(tmpdir.join('journal.jsonl'))
+    compute.all_complexes(disconnected, (0, 0, 0), checkpoint=path)
+
+    with pytest.raises(ValueError):
+        compute.complexes(disconnected, (0, 0, 0), checkpoint=path)
+    with pytest.raises(ValueError):
+        compute.all_complexes(disconnected, (1, 0, 0), checkpoint=path)
+    with config.override(MEASURE='L1'):
+        with pytest.raises(ValueError):
+            compute.all_complexes(disconnected, (0, 0, 0), checkpoint=path)
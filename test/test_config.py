@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 # test_config.py
 
+import asyncio
 import logging
 import os
+import threading
 
 import pytest
 
@@ -159,3 +161,93 @@ def test_config_validation(name, valid, invalid):
     for value in invalid:
         with pytest.raises(ValueError):
             setattr(config, name, value)
+
+
+def test_local(c):
+    with c.local(SPEED='slow'):
+        assert c.SPEED == 'slow'
+        assert c.local_values() == {'SPEED': 'slow'}
+        assert c.snapshot() == {'SPEED': 'slow'}
+        # Global value is unchanged
+        assert c._values['SPEED'] == 'default'
+    assert c.SPEED == 'default'
+    assert c.local_values() == {}
+
+
+def test_local_cleans_up_after_exception(c):
+    try:
+        with c.local(SPEED='slow'):
+            raise ValueError('Oops')
+    except ValueError:
+        pass
+    assert c.SPEED == 'default'
+
+
+def test_local_validation(c):
+    with pytest.raises(ValueError):
+        c.local(SPEED='warp')
+    with pytest.raises(ValueError):
+        c.local(NOT_AN_OPTION=1)
+    with pytest.raises(ValueError):
+        config.local(LOG_STDOUT_LEVEL='DEBUG')
+
+
+def test_set_option_inside_local(c):
+    with c.local(SPEED='slow'):
+        c.SPEED = 'fast'
+        assert c.SPEED == 'fast'
+        with c.override(SPEED='default'):
+            assert c.SPEED == 'default'
+        assert c.SPEED == 'fast'
+    assert c.SPEED == 'default'
+
+
+def test_local_as_decorator_is_reentrant(c):
+    @c.local(SPEED='slow')
+    def f(depth):
+        assert c.SPEED == 'slow'
+        if depth:
+            f(depth - 1)
+        assert c.SPEED == 'slow'
+
+    f(2)
+    assert c.SPEED == 'default'
+
+
+def test_local_is_isolated_between_threads(c):
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def worker(speed):
+        with c.local(SPEED=speed):
+            # Make sure both threads are inside their ``local`` blocks
+            barrier.wait()
+            seen[speed] = c.SPEED
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker, args=(speed,))
+               for speed in ['slow', 'fast']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {'slow': 'slow', 'fast': 'fast'}
+    assert c.SPEED == 'default'
+
+
+def test_local_is_isolated_between_tasks(c):
+    async def task(speed):
+        with c.local(SPEED=speed):
+            await asyncio.sleep(0.01)
+            return c.SPEED
+
+    async def main():
+        return await asyncio.gather(task('slow'), task('fast'))
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) == ['slow', 'fast']
+    finally:
+        loop.close()
+    assert c.SPEED == 'default'
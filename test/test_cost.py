@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# test_cost.py
+
+import pytest
+
+from pyphi import Direction, Subsystem, compute, config, examples, utils
+from pyphi.compute import cost
+from pyphi.partition import mip_partitions
+
+
+@pytest.mark.parametrize('partition_type', ['BI', 'TRI', 'ALL'])
+def test_count_partitions(partition_type):
+    with config.override(PARTITION_TYPE=partition_type):
+        for mechanism_size in range(1, 4):
+            for purview_size in range(1, 4):
+                mechanism = tuple(range(mechanism_size))
+                purview = tuple(range(mechanism_size,
+                                      mechanism_size + purview_size))
+                expected = sum(1 for _ in mip_partitions(mechanism, purview))
+                assert cost.count_partitions(
+                    mechanism_size, purview_size) == expected
+
+
+def test_estimate_cost(s):
+    estimate = compute.estimate_cost(s)
+
+    purviews = [
+        (mechanism, purview)
+        for direction in (Direction.CAUSE, Direction.EFFECT)
+        for mechanism in utils.powerset(s.node_indices, nonempty=True)
+        for purview in s.potential_purviews(direction, mechanism)]
+    partitions = sum(
+        sum(1 for _ in mip_partitions(mechanism, purview))
+        for mechanism, purview in purviews)
+
+    assert estimate.mechanisms == 7
+    assert estimate.purviews == len(purviews)
+    assert estimate.partitions == partitions
+    assert estimate.cuts == 6
+    assert estimate.time > 0
+    assert estimate.memory > 0
+
+
+def test_estimate_cost_single_node():
+    subsystem = Subsystem(examples.fig16(), (0,) * 7, (0,))
+    estimate = compute.estimate_cost(subsystem)
+    assert estimate.mechanisms == 1
+    assert estimate.cuts == 1
+
+
+def test_estimate_cost_grows_with_size():
+    network = examples.fig16()
+    small = compute.estimate_cost(Subsystem(network, (0,) * 7, (0, 1, 2)))
+    large = compute.estimate_cost(Subsystem(network, (0,) * 7))
+    assert large.cuts > small.cuts
+    assert large.time > small.time
+    assert large.memory > small.memory
+
+
+def test_estimate_cost_timings(s):
+    timings = {'mip': 1, 'distance': 0}
+    estimate = compute.estimate_cost(s, timings=timings)
+    assert estimate.time == estimate.mip_work * (estimate.cuts + 1)
+
+
+def test_calibrate(s, monkeypatch):
+    monkeypatch.setattr(cost, 'TIMINGS', dict(cost.TIMINGS))
+    timings = cost.calibrate(s)
+    assert timings is cost.TIMINGS
+    assert timings['mip'] > 0
+    assert timings['distance'] > 0
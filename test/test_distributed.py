@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# test_distributed.py
+
+import multiprocessing
+import pickle
+
+import pytest
+
+from pyphi import cache, compute, config, examples
+from pyphi.compute import distributed, parallel
+
+require_redis = pytest.mark.skipif(not cache.redis_available(),
+                                   reason="requires a running Redis server")
+
+pytestmark = require_redis
+
+
+@pytest.fixture
+def workers():
+    """Start two worker daemons for the duration of a test."""
+    processes = [multiprocessing.Process(target=distributed.work, daemon=True)
+                 for i in range(2)]
+    for process in processes:
+        process.start()
+    yield processes
+    for process in processes:
+        process.terminate()
+        process.join()
+
+
+class MapSquare(parallel.MapReduce):
+
+    def empty_result(self):
+        return set()
+
+    @staticmethod
+    def compute(num):
+        return num ** 2
+
+    def process_result(self, new, previous):
+        previous.add(new)
+        return previous
+
+
+class MapError(MapSquare):
+
+    @staticmethod
+    def compute(num):
+        raise Exception("I don't wanna!")
+
+
+class MapShortCircuit(MapSquare):
+
+    def process_result(self, new, previous):
+        self.done = True
+        return new
+
+
+class MapConfig(MapSquare):
+
+    @staticmethod
+    def compute(num):
+        return (config.MEASURE, config.PARALLEL_BACKEND)
+
+
+@config.override(PARALLEL_BACKEND='redis')
+def test_map_square(workers):
+    assert MapSquare([1, 2, 3]).run_parallel() == {1, 4, 9}
+
+
+@config.override(PARALLEL_BACKEND='redis')
+def test_exception_handling(workers):
+    with pytest.raises(Exception, match=r"I don't wanna!"):
+        MapError([1]).run(parallel=True)
+
+
+def test_finished_job_tasks_are_dropped():
+    conn = cache.redis_conn
+    job = distributed.Job(MapSquare.compute, ())
+    job.start()
+    assert job.put(range(10)) == 10
+    assert pickle.loads(conn.lindex(distributed.TASK_QUEUE, 0)) == (
+        job.job_id, 0)
+    job.finish()
+
+    assert conn.exists('pyphi:job:{}:complete'.format(job.job_id))
+    assert not conn.exists('pyphi:job:{}:context'.format(job.job_id))
+
+    # Workers drop the remaining tasks of the completed job
+    distributed.work(burst=True)
+    assert conn.llen(distributed.TASK_QUEUE) == 0
+    assert not conn.exists('pyphi:job:{}:results'.format(job.job_id))
+
+
+@config.override(PARALLEL_BACKEND='redis')
+def test_engine_short_circuit(workers):
+    assert MapShortCircuit(range(100)).run_parallel() in {
+        n ** 2 for n in range(100)}
+
+
+@config.override(PARALLEL_BACKEND='redis')
+def test_workers_use_client_config(workers):
+    with config.local(MEASURE='L1'):
+        assert MapConfig([1, 2, 3]).run_parallel() == {('L1', 'process')}
+
+
+@config.override(PARALLEL_BACKEND='redis', PARALLEL_CUT_EVALUATION=True)
+def test_distributed_sia(workers):
+    subsystem = examples.basic_subsystem()
+    sia = compute.sia(subsystem)
+    with config.override(PARALLEL_BACKEND='process'):
+        assert sia == compute.sia(subsystem)
+
+
+@config.override(PARALLEL_BACKEND='redis')
+def test_run_iter(workers):
+    assert sorted(MapSquare([1, 2, 3]).run_iter(parallel=True)) == [1, 4, 9]
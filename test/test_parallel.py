@@ -2,11 +2,13 @@
 # -*- coding: utf-8 -*-
 # test_parallel.py
 
+import asyncio
+import time
 from unittest.mock import patch
 
 import pytest
 
-from pyphi import config
+from pyphi import compute, config, examples
 from pyphi.compute import parallel
 
 
@@ -54,10 +56,26 @@ class MapSquare(parallel.MapReduce):
         return previous
 
 
-def test_map_square():
-    engine = MapSquare([1, 2, 3])
-    assert engine.run_parallel() == {1, 4, 9}
-    assert engine.run_sequential() == {1, 4, 9}
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_map_square(backend):
+    with config.override(PARALLEL_BACKEND=backend):
+        engine = MapSquare([1, 2, 3])
+        assert engine.run_parallel() == {1, 4, 9}
+        assert engine.run_sequential() == {1, 4, 9}
+
+
+class MapShortCircuit(MapSquare):
+
+    def process_result(self, new, previous):
+        self.done = True
+        return new
+
+
+@config.override(PARALLEL_BACKEND='thread')
+def test_thread_backend_short_circuit():
+    engine = MapShortCircuit(range(100))
+    assert engine.run_parallel() in {n ** 2 for n in range(100)}
+    assert all(not thread.is_alive() for thread in engine.processes)
 
 
 def test_materialize_list_only_when_needed():
@@ -77,6 +95,130 @@ class MapError(MapSquare):
         raise Exception("I don't wanna!")
 
 
-def test_parallel_exception_handling():
-    with pytest.raises(Exception, match=r"I don't wanna!"):
-        MapError([1]).run(parallel=True)
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_parallel_exception_handling(backend):
+    with config.override(PARALLEL_BACKEND=backend):
+        with pytest.raises(Exception, match=r"I don't wanna!"):
+            MapError([1]).run(parallel=True)
+
+
+@config.override(PARALLEL_BACKEND='thread', PARALLEL_CONCEPT_EVALUATION=True)
+def test_thread_backend_shares_subsystem_caches():
+    subsystem = examples.basic_subsystem()
+    ces = compute.ces(subsystem)
+    # All workers used the same subsystem, so the caches are populated in
+    # the calling thread.
+    assert subsystem._repertoire_cache.size() > 0
+    assert subsystem._mice_cache.size() > 0
+
+    with config.override(PARALLEL_CONCEPT_EVALUATION=False):
+        assert ces == compute.ces(examples.basic_subsystem())
+
+
+class MapConfig(parallel.MapReduce):
+
+    def empty_result(self):
+        return set()
+
+    @staticmethod
+    def compute(obj):
+        return config.MEASURE
+
+    def process_result(self, new, previous):
+        previous.add(new)
+        return previous
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_workers_inherit_local_config(backend):
+    with config.override(PARALLEL_BACKEND=backend):
+        with config.local(MEASURE='L1'):
+            assert MapConfig([1, 2, 3]).run_parallel() == {'L1'}
+
+
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+@pytest.mark.parametrize('parallel', [True, False])
+def test_run_async(backend, parallel):
+    results = []
+    with config.override(PARALLEL_BACKEND=backend):
+        engine = MapSquare([1, 2, 3])
+        assert run_async(engine.run_async(parallel, results.append)) == {
+            1, 4, 9}
+    assert sorted(results) == [1, 4, 9]
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_run_async_exception_handling(backend):
+    with config.override(PARALLEL_BACKEND=backend):
+        with pytest.raises(Exception, match=r"I don't wanna!"):
+            run_async(MapError([1]).run_async(parallel=True))
+
+
+class MapSleep(MapSquare):
+
+    @staticmethod
+    def compute(num):
+        time.sleep(num)
+        return num
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_run_async_cancellation(backend):
+    async def main(engine):
+        task = asyncio.ensure_future(engine.run_async(parallel=True))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with config.override(PARALLEL_BACKEND=backend, NUMBER_OF_CORES=2):
+        engine = MapSleep([1] * 100)
+        start = time.time()
+        run_async(main(engine))
+
+    assert engine.complete.is_set()
+    for worker in engine.processes:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    # Not all tasks were computed
+    assert time.time() - start < 30
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+@pytest.mark.parametrize('parallel', [True, False])
+def test_run_iter(backend, parallel):
+    with config.override(PARALLEL_BACKEND=backend):
+        results = MapSquare([1, 2, 3]).run_iter(parallel)
+        assert sorted(results) == [1, 4, 9]
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_run_iter_exception_handling(backend):
+    with config.override(PARALLEL_BACKEND=backend):
+        with pytest.raises(Exception, match=r"I don't wanna!"):
+            list(MapError([1]).run_iter(parallel=True))
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_run_iter_close(backend):
+    with config.override(PARALLEL_BACKEND=backend, NUMBER_OF_CORES=2):
+        engine = MapSleep([0.1] * 100)
+        start = time.time()
+        results = engine.run_iter(parallel=True)
+        assert next(results) == 0.1
+        results.close()
+
+    assert engine.complete.is_set()
+    for worker in engine.processes:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    # Not all tasks were computed
+    assert time.time() - start < 5